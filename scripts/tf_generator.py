@@ -4,11 +4,13 @@ import matplotlib.pyplot as plt
 from typing import Dict, List, Optional
 
 class TransferFunction:
-    MAGIC_NUMBER = b'TF01'  # Magic number to identify the transfer function file format
+    MAGIC_NUMBER = b'TF02'  # Magic number to identify the transfer function file format
+    LEGACY_MAGIC_NUMBER = b'TF01'  # Earlier format with float32 colours and no data type tag
+    DTYPE_CODES = {np.dtype(np.float32): 0, np.dtype(np.uint8): 1}  # Colour data type tags stored in the header
     
     def __init__(self) -> None:
         self.n_colours: int = 0
-        self._data: Optional[bytes] = None
+        self._array: Optional[np.ndarray] = None
 
     def save(self, output_filename: str) -> None:
         """Create a new transfer function file"""
@@ -17,8 +19,9 @@ class TransferFunction:
             f.write(TransferFunction.MAGIC_NUMBER)
             # Write header
             f.write(struct.pack('I', self.n_colours))
-            # Write colour data
-            f.write(self._data)
+            f.write(struct.pack('I', TransferFunction.DTYPE_CODES[self._array.dtype]))
+            # Write colour data directly from the array buffer
+            f.write(self._array)
 
     @classmethod
     def create(cls, colours: np.ndarray) -> 'TransferFunction':
@@ -26,16 +29,49 @@ class TransferFunction:
         Create a transfer function from a numpy array of RGBA colours
         
         Args:
-            colours: numpy array of shape (n, 4) with float32 values
+            colours: numpy array of shape (n, 4) with float32 values in [0, 1],
+                or uint8 values in [0, 255]
             
         Returns:
             A new TransferFunction instance
         """
         tf = cls()
         tf.n_colours = len(colours)
-        tf._data = colours.astype(np.float32).tobytes()
+        dtype = np.uint8 if colours.dtype == np.uint8 else np.float32
+        tf._array = np.ascontiguousarray(colours, dtype=dtype)
         return tf
-    
+
+    @classmethod
+    def load(cls, filename: str) -> 'TransferFunction':
+        """
+        Load a transfer function file, reading its colour data into memory
+
+        Args:
+            filename: path to a transfer function file in the current or legacy (float32) format
+
+        Returns:
+            A new TransferFunction instance
+        """
+        with open(filename, 'rb') as f:
+            magic = f.read(4)
+            if magic not in (TransferFunction.LEGACY_MAGIC_NUMBER, TransferFunction.MAGIC_NUMBER):
+                raise ValueError(f'Invalid transfer function: {filename}')
+            n_colours, = struct.unpack('I', f.read(4))
+            dtype = np.dtype(np.float32)
+            if magic == TransferFunction.MAGIC_NUMBER:
+                code, = struct.unpack('I', f.read(4))
+                dtypes = {c: d for d, c in TransferFunction.DTYPE_CODES.items()}
+                if code not in dtypes:
+                    raise ValueError(f'Unsupported transfer function data type: {code}')
+                dtype = dtypes[code]
+            # Read the whole LUT in one go, so the file can later be saved over safely
+            colours = np.fromfile(f, dtype=dtype, count=n_colours * 4).reshape(n_colours, 4)
+
+        tf = cls()
+        tf.n_colours = n_colours
+        tf._array = colours
+        return tf
+
     def plot(self, output_path: Optional[str] = None) -> None:
         """
         Plot a visualisation of the transfer function
@@ -43,8 +79,9 @@ class TransferFunction:
         Args:
             output_path: if provided, save the plot to this path
         """
-        # Convert bytes back to numpy array
-        colours = np.frombuffer(self._data, dtype=np.float32).reshape(self.n_colours, 4)
+        colours = self._array
+        if colours.dtype == np.uint8:
+            colours = colours / 255
         
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 8), gridspec_kw={'height_ratios': [1, 3]})
         
@@ -93,9 +130,6 @@ def create_basic_tf(n_colours: int = 8192, output_path: str = 'basic.tf') -> Non
     - Bone: white/ivory, mostly opaque
     """
     
-    # Create array for colours
-    colours = np.zeros((n_colours, 4), dtype=np.float32)
-    
     # Define key density points and their RGBA values
     # Values are normalized to [0, 1]
     key_points: Dict[int, List[float]] = {
@@ -107,23 +141,15 @@ def create_basic_tf(n_colours: int = 8192, output_path: str = 'basic.tf') -> Non
         4200: [0.9, 0.9, 0.7, 0.9], # Bone
     }
     
-    # Interpolate between key points
-    points = sorted(key_points.keys())
-    for i in range(len(points)-1):
-        start_idx = points[i]
-        end_idx = points[i+1]
-        start_colour = key_points[start_idx]
-        end_colour = key_points[end_idx]
-        
-        # Linear interpolation between key points
-        for idx in range(start_idx, end_idx + 1):
-            if idx < n_colours:
-                t = (idx - start_idx) / (end_idx - start_idx)
-                colours[idx] = np.array(start_colour) * (1-t) + np.array(end_colour) * t
+    # Interpolate each RGBA channel between key points, indices past the
+    # last key point are filled with the last colour by np.interp
+    xp = np.fromiter(sorted(key_points), dtype=np.int32)
+    fp = np.array([key_points[int(k)] for k in xp], dtype=np.float32)
+    x = np.arange(n_colours, dtype=np.float32)
+    colours = np.stack([np.interp(x, xp, fp[:, c]) for c in range(4)], axis=1).astype(np.float32)
     
-    # Fill in any remaining indices with the last colour
-    if points[-1] < n_colours - 1:
-        colours[points[-1]+1:] = key_points[points[-1]]
+    # Quantise to 8 bits per channel, sampled on the GPU as an rgba8unorm texture
+    colours = np.clip(colours * 255 + 0.5, 0, 255).astype(np.uint8)
     
     tf = TransferFunction.create(colours)
     tf.save(output_path)
@@ -8,8 +8,8 @@ import { GlobalGUI } from './gui';
 export class Engine {
     private _volume: Volume;
     private _transferFunction: TransferFunction;
-    private _volumeIDs: string[] = [];
-    private _transferFunctionIDs: string[] = [];
+    private _volumeIDs = new Set<string>();
+    private _transferFunctionIDs = new Set<string>();
     private _adapter: GPUAdapter;
     private _device: GPUDevice;
     private _queue: GPUQueue;
@@ -40,8 +40,8 @@ export class Engine {
 
     public get volume(): Volume { return this._volume; }
     public get transferFunction(): TransferFunction { return this._transferFunction; }
-    public get volumeIDs(): string[] { return this._volumeIDs; }
-    public get transferFunctionIDs(): string[] { return this._transferFunctionIDs; }
+    public get volumeIDs(): ReadonlySet<string> { return this._volumeIDs; }
+    public get transferFunctionIDs(): ReadonlySet<string> { return this._transferFunctionIDs; }
     public get device(): GPUDevice { return this._device; }
     public get queue(): GPUQueue { return this._queue; }
     public get displayFormat(): GPUTextureFormat { return navigator.gpu.getPreferredCanvasFormat(); }
@@ -58,10 +58,7 @@ export class Engine {
             const volume = new Volume(folderName);
             await volume.load(files);
             this._volume = volume;
-            
-            if (!this._volumeIDs.includes(volume.name)) {
-                this._volumeIDs.push(volume.name);
-            }
+            this._volumeIDs.add(volume.name);
             
             console.log(`Loaded Volume ${this._volume.name}`);
         } catch (error) {
@@ -78,10 +75,7 @@ export class Engine {
             const tf = new TransferFunction(file.name);
             await tf.load(file);
             this._transferFunction = tf;
-            
-            if (!this._transferFunctionIDs.includes(tf.name)) {
-                this._transferFunctionIDs.push(tf.name);
-            }
+            this._transferFunctionIDs.add(tf.name);
             
             console.log(`Loaded Transfer Function ${this._transferFunction.name}`);
         } catch (error) {
@@ -20,8 +20,11 @@ export class GlobalGUI {
             const files = (e.target as HTMLInputElement).files;
             if (!files?.length) return;
             
-            const folderName = files[0].webkitRelativePath.split('/')[0];
-            await engine.loadVolume(Array.from(files), folderName);
+            // Directory selection ignores the accept filter, so skip hidden files and the DICOMDIR index
+            // before reading them. DICOM files often have no extension, so anything else is left to the parser
+            const dicomFiles = Array.from(files).filter(file => !file.name.startsWith('.') && file.name.toUpperCase() !== 'DICOMDIR');
+            const folderName = dicomFiles[0]?.webkitRelativePath.split('/')[0];
+            await engine.loadVolume(dicomFiles, folderName);
             engine.reloadAllRenderers();
         };
 
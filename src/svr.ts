@@ -30,13 +30,13 @@ export class RendererSVR extends Renderer {
         
         this.transferFunctionTexture = this.engine.device.createTexture({
             size: tf.size,
-            format: 'rgba32float',
+            format: tf.format,
             usage: GPUTextureUsage.COPY_DST | GPUTextureUsage.TEXTURE_BINDING,
             dimension: '1d'
         });
 
-        // Calculate bytesPerRow (4 bytes per component * 4 components * size[0])
-        const bytesPerRow = tf.size[0] * 4 * 4;
+        // Calculate bytesPerRow (bytes per RGBA texel * size[0])
+        const bytesPerRow = tf.size[0] * tf.bytesPerTexel;
         
         const imageDataLayout = {
             offset: 0,
@@ -1,35 +1,59 @@
 export class TransferFunction {
     private _name: string;
     private _size: number;
-    private _data: ArrayBuffer;
+    private _format: GPUTextureFormat;
+    private _bytesPerTexel: number;
+    private _data: Uint8Array;
     
     // Identifies the transfer function file format
-    public readonly MAGIC_NUMBER = 'TF01';
+    public readonly MAGIC_NUMBER = 'TF02';
+    public readonly LEGACY_MAGIC_NUMBER = 'TF01';
+
+    // Texture formats indexed by the colour data type tag stored in the header
+    private readonly FORMATS: [GPUTextureFormat, number][] = [
+        ['rgba32float', 16],
+        ['rgba8unorm', 4]
+    ];
     
     constructor(name?: string) {
         this._name = name || '';
         this._size = 1;
-        this._data = new ArrayBuffer(0);
+        [this._format, this._bytesPerTexel] = this.FORMATS[0];
+        this._data = new Uint8Array(0);
     }
 
     public get name(): string { return this._name; }
     public get size(): number[] { return [this._size]; }
-    public get data(): ArrayBuffer { return this._data; }
+    public get format(): GPUTextureFormat { return this._format; }
+    public get bytesPerTexel(): number { return this._bytesPerTexel; }
+    public get data(): Uint8Array { return this._data; }
 
     public async load(file: File): Promise<void> {
         const buffer = await file.arrayBuffer();
         const view = new DataView(buffer);
         
-        // Check magic number 'TF01'
+        // Check magic number, 'TF01' files always hold float32 colours
         const magic = new TextDecoder().decode(buffer.slice(0, 4));
-        if (magic !== this.MAGIC_NUMBER) {
+        if (magic !== this.MAGIC_NUMBER && magic !== this.LEGACY_MAGIC_NUMBER) {
             throw new Error('Invalid transfer function');
         }
 
         // Read size of transfer function (4 bytes after magic number)
         this._size = view.getUint32(4, true);
+
+        // Read colour data type tag (4 bytes after size, keeping the colour data 4-byte aligned)
+        let headerSize = 8;
+        let dtype = 0;
+        if (magic === this.MAGIC_NUMBER) {
+            dtype = view.getUint32(8, true);
+            headerSize = 12;
+        }
+        if (!this.FORMATS[dtype]) {
+            throw new Error(`Unsupported transfer function data type: ${dtype}`);
+        }
+        [this._format, this._bytesPerTexel] = this.FORMATS[dtype];
         
-        // Store the remaining data (color data)
-        this._data = buffer.slice(8); // Skip magic number and size
+        // View the remaining data (color data) without copying it
+        this._data = new Uint8Array(buffer, headerSize); // Skip header
     }
-}
\ No newline at end of file
+}
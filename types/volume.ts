@@ -35,9 +35,9 @@ export class Volume {
 
         const series = new daikon.Series();
         
-        // Load all files into the series
-        for (const file of files) {
-            const buffer = await file.arrayBuffer();
+        // Read all files concurrently, then load them into the series
+        const buffers = await Promise.all(files.map(file => file.arrayBuffer()));
+        for (const buffer of buffers) {
             const image = daikon.Series.parseImage(new DataView(buffer));
             
             if (image?.hasPixelData()) {
@@ -66,17 +66,16 @@ export class Volume {
         const totalVoxels = this._size[0] * this._size[1] * this._size[2];
         const volumeData = new Uint16Array(totalVoxels);
         const shift = 2 ** 15;
-        
+        const sliceSize = this._size[0] * this._size[1];
+
         // Process each slice
         for (let i = 0; i < series.images.length; i++) {
             const image = series.images[i];
             const pixelData = image.getInterpretedData();
-            const sliceSize = this._size[0] * this._size[1];
             const sliceOffset = i * sliceSize;
-            
+
             const rescaleSlope = image.getDataScaleSlope() || 1;
-            const rescaleIntercept = image.getDataScaleIntercept() || 0;
-            
+
             // Apply rescaling to each voxel
             for (let j = 0; j < sliceSize; j++) {
                 volumeData[sliceOffset + j] = Math.round(rescaleSlope * pixelData[j] + shift);